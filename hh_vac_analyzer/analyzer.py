@@ -5,17 +5,70 @@ HH.ru Vacancy Analyzer - Automatic normalization without hardcoding
 
 import json
 import re
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import combinations, islice
 from collections import Counter, defaultdict
-from difflib import SequenceMatcher
+from dataclasses import dataclass, field
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:  # optional, without it soft needles and skill scans use plain `in` checks
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional, without it the whole file is parsed up front
+    ijson = None
+
 
 def load_vacancies(filepath: str) -> list:
-    with open(filepath, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(Path(filepath).read_bytes())
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
     return data.get('vacancies', [])
 
 
+def iter_vacancies(filepath: str):
+    """Yields vacancies one at a time, streaming the file when ijson is available."""
+    if ijson is None:
+        yield from load_vacancies(filepath)
+        return
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, 'vacancies.item', use_float=True)
+
+
+def save_results(data: dict, filepath: str):
+    if orjson is not None:
+        Path(filepath).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+# The same skill strings repeat across vacancies and are looked up by several
+# helpers, so each unique string is lowercased only once
+_lower = lru_cache(maxsize=None)(str.lower)
+
+
+# Every ASCII byte except a-z and 0-9. Encoding with errors='ignore' drops the
+# non-ASCII characters, so bytes.translate leaves exactly what [^a-z0-9] keeps
+_NON_ALNUM_BYTES = bytes(c for c in range(128) if not (ord('0') <= c <= ord('9') or ord('a') <= c <= ord('z')))
+
+
+def _lookup_key(text_lower: str) -> str:
+    """Same as re.sub(r'[^a-z0-9]', '', text_lower), in one C pass."""
+    return text_lower.encode('ascii', 'ignore').translate(None, _NON_ALNUM_BYTES).decode('ascii')
+
+
 class SkillNormalizer:
     """Normalizes skills using a predefined dictionary of synonyms."""
     
@@ -82,48 +135,109 @@ class SkillNormalizer:
         self.mapping = {}
         for variant, canonical in self.SYNONYMS.items():
             # Handle cases like "C++" vs "c  "
-            processed_variant = re.sub(r'[^a-z0-9]', '', variant.lower())
+            processed_variant = _lookup_key(variant.lower())
             self.mapping[processed_variant] = canonical
+        # Raw skill -> canonical form, skills repeat a lot across vacancies
+        self._cache = {}
 
     def normalize(self, skill: str) -> str:
         """Finds the canonical form of a skill."""
+        hit = self._cache.get(skill)
+        if hit is not None:
+            return hit
+
         # Clean the skill name for lookup
-        processed_skill = re.sub(r'[^a-z0-9]', '', skill.lower())
+        processed_skill = _lookup_key(_lower(skill))
         
-        # Direct match in the synonym map
-        if processed_skill in self.mapping:
-            return self.mapping[processed_skill]
-            
-        # If no synonym found, return the original skill, capitalized for consistency
-        return skill.strip().title()
-
-
+        # Direct match in the synonym map, if no synonym found, return the
+        # original skill, capitalized for consistency
+        canonical = self.mapping.get(processed_skill) or skill.strip().title()
+        self._cache[skill] = canonical
+        return canonical
+
+
+# The synonym map is built once at import and its cache is shared by every run
+NORMALIZER = SkillNormalizer()
+
+
+SOFT_PATTERNS = [
+    r'коммуникаб', r'ответствен', r'стрессоуст', r'самостоятел',
+    r'инициатив', r'обучаем', r'внимател', r'аккуратн',
+    r'командн', r'работа в команд', r'team.?work', r'communication',
+    r'leadership', r'лидерств', r'мотивац', r'дисциплин',
+    r'пунктуальн', r'исполнительн', r'креатив', r'гибкост',
+    r'адаптив', r'многозадачн', r'тайм.?менеджмент', r'time.?management',
+    r'problem.?solving', r'решение проблем', r'аналитическ.*мышлен',
+    r'критическ.*мышлен', r'переговор', r'презентац',
+]
+
+LANGUAGE_PATTERNS = [
+    r'английский.*[—\-–].*[A-C][1-2]',
+    r'english.*[—\-–].*[A-C][1-2]',
+    r'^[A-C][1-2]\s*[—\-–]',
+    r'(intermediate|upper|beginner|advanced|native|fluent)',
+    r'(средний|продвинут|начальн|свободн|базов).*уровень',
+]
+
+
+def _fuse(patterns: list) -> re.Pattern:
+    """Compiles a list of patterns into a single case-insensitive alternation."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns), re.IGNORECASE)
+
+
+def _fuse_ranked(patterns_by_name: dict) -> re.Pattern:
+    """Fuses pattern groups into one regex for match(): group k (1-based) is set
+    when the k-th name in dict order is the first one with a hit anywhere."""
+    branches = (
+        f".*?({'|'.join(f'(?:{p})' for p in patterns)})"
+        for patterns in patterns_by_name.values()
+    )
+    return re.compile('|'.join(branches), re.IGNORECASE | re.DOTALL)
+
+
+def _build_automaton(words: list):
+    """Builds an Aho-Corasick automaton matching any of the given words."""
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word, word)
+    automaton.make_automaton()
+    return automaton
+
+
+# Most soft patterns are plain substrings: they are matched in one linear pass
+# by Aho-Corasick (or by plain `in` checks without it), only the few real
+# regexes go through the regex engine. All of them run on the lowercased skill,
+# which is cheaper than IGNORECASE matching.
+SOFT_LITERALS = tuple(p for p in SOFT_PATTERNS if not set(p) & set('.*?+()[]{}|^$\\'))
+SOFT_REGEX_RE = re.compile('|'.join(f'(?:{p})' for p in SOFT_PATTERNS if p not in SOFT_LITERALS))
+SOFT_AC = _build_automaton(SOFT_LITERALS) if ahocorasick else None
+
+# Compiled once at import: one scan per string instead of one per pattern
+LANG_RE = _fuse(LANGUAGE_PATTERNS)
+# Every language pattern needs a level code, a level word or 'уровень'; this
+# flat alternation rejects most skills before the backtracking patterns run
+LANG_HINT_RE = re.compile(
+    r'[A-C][1-2]|intermediate|upper|beginner|advanced|native|fluent|уровень', re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=None)
 def is_soft_skill(skill: str) -> bool:
     """Detect soft skills by patterns"""
-    soft_patterns = [
-        r'коммуникаб', r'ответствен', r'стрессоуст', r'самостоятел',
-        r'инициатив', r'обучаем', r'внимател', r'аккуратн',
-        r'командн', r'работа в команд', r'team.?work', r'communication',
-        r'leadership', r'лидерств', r'мотивац', r'дисциплин',
-        r'пунктуальн', r'исполнительн', r'креатив', r'гибкост',
-        r'адаптив', r'многозадачн', r'тайм.?менеджмент', r'time.?management',
-        r'problem.?solving', r'решение проблем', r'аналитическ.*мышлен',
-        r'критическ.*мышлен', r'переговор', r'презентац',
-    ]
-    skill_lower = skill.lower()
-    return any(re.search(p, skill_lower) for p in soft_patterns)
+    skill_lower = _lower(skill)
+    if SOFT_AC is not None:
+        has_literal = next(SOFT_AC.iter(skill_lower), None) is not None
+    else:
+        has_literal = any(literal in skill_lower for literal in SOFT_LITERALS)
+    return has_literal or SOFT_REGEX_RE.search(skill_lower) is not None
 
 
+@lru_cache(maxsize=None)
 def is_language_level(skill: str) -> bool:
     """Detect language proficiency markers"""
-    patterns = [
-        r'английский.*[—\-–].*[A-C][1-2]',
-        r'english.*[—\-–].*[A-C][1-2]',
-        r'^[A-C][1-2]\s*[—\-–]',
-        r'(intermediate|upper|beginner|advanced|native|fluent)',
-        r'(средний|продвинут|начальн|свободн|базов).*уровень',
-    ]
-    return any(re.search(p, skill, re.IGNORECASE) for p in patterns)
+    if not LANG_HINT_RE.search(skill):
+        return False
+    return LANG_RE.search(skill) is not None
 
 
 def get_stop_words():
@@ -143,172 +257,225 @@ def get_stop_words():
     return set(russian_stop_words + english_stop_words)
 
 
-def analyze_skills(vacancies: list) -> dict:
-    """Categorizes skills first, then normalizes them."""
-    
-    raw_technical = []
-    raw_soft = []
-    raw_languages = []
-
-    # 1. Categorize first
+@dataclass
+class Accumulators:
+    """Running state of the single pass over vacancies. The pass only updates
+    these fields; each analyze_* function then summarizes its part."""
+    total: int = 0
+    # analyze_skills
+    skills_raw_tech: list = field(default_factory=list)
+    skills_raw_soft: list = field(default_factory=list)
+    skills_raw_lang: list = field(default_factory=list)
+    skill_classes: dict = field(default_factory=dict)  # raw -> (category, canonical)
+    tech_ids: dict = field(default_factory=dict)  # canonical technical skill -> int id
+    combos: Counter = field(default_factory=Counter)
+    # analyze_salaries
+    salary_values: list = field(default_factory=list)  # (value, experience) pairs
+    with_salary: int = 0
+    # analyze_experience, analyze_companies
+    exp_counter: Counter = field(default_factory=Counter)
+    company_counter: Counter = field(default_factory=Counter)
+    # analyze_titles
+    title_counter: Counter = field(default_factory=Counter)
+    seniority: Counter = field(default_factory=Counter)
+    roles: Counter = field(default_factory=Counter)
+    # analyze_locations
+    city_counter: Counter = field(default_factory=Counter)
+    remote_count: int = 0
+    hybrid_count: int = 0
+    # analyze_descriptions
+    desc_keyword_counter: Counter = field(default_factory=Counter)
+    with_description: int = 0
+    # analyze_dynamic_keywords
+    bigram_counter: Counter = field(default_factory=Counter)  # (word, word) -> count
+    # analyze_skill_context needs the final technical skills, so it runs over
+    # the kept non-empty descriptions, already lowercased, after the pass.
+    # This is the bulk of the input and is held until then
+    descriptions_lower: list = field(default_factory=list)
+
+
+def accumulate(vacancies, stop_words: set) -> Accumulators:
+    """Walks the vacancies (any iterable) once, updating every accumulator."""
+    acc = Accumulators()
     for v in vacancies:
-        for skill in v.get('skills', []):
+        acc.total += 1
+        exp = v.get('experience') or 'Не указан'
+        acc.exp_counter[exp] += 1
+        acc.company_counter[(v.get('company') or {}).get('name') or 'Не указана'] += 1
+        loc = v.get('location')
+        acc.city_counter[loc.split(',', 1)[0].strip() if loc else 'Не указан'] += 1
+
+        _add_skills(acc, v.get('skills', []))
+        _add_salary(acc, v.get('salary'), exp)
+        _add_title(acc, v.get('title', ''))
+        _add_description(acc, v.get('description') or '', stop_words)
+    return acc
+
+
+def _add_skills(acc: Accumulators, skills: list):
+    """Categorizes one vacancy's skills and counts its technical skill pairs.
+
+    Each unique raw skill is classified and normalized once into
+    (category, canonical); canonical technical skills get int ids on first sight.
+    """
+    buckets = {'technical': acc.skills_raw_tech, 'soft': acc.skills_raw_soft, 'languages': acc.skills_raw_lang}
+    vacancy_ids = set()
+    for skill in skills:
+        entry = acc.skill_classes.get(skill)
+        if entry is None:
             if is_language_level(skill):
-                raw_languages.append(skill)
+                category = 'languages'
             elif is_soft_skill(skill):
-                raw_soft.append(skill)
+                category = 'soft'
             else:
-                raw_technical.append(skill)
-
-    normalizer = SkillNormalizer()
+                category = 'technical'
+            entry = acc.skill_classes[skill] = (category, NORMALIZER.normalize(skill))
+        category, canonical = entry
+        buckets[category].append(skill)
+        if category == 'technical':
+            vacancy_ids.add(acc.tech_ids.setdefault(canonical, len(acc.tech_ids)))
+    # Sorted ids make combinations() yield each pair as (i, j) with i < j;
+    # update() counts the int pairs in C instead of one increment per pair
+    acc.combos.update(combinations(sorted(vacancy_ids), 2))
+
+
+def analyze_skills(acc: Accumulators) -> dict:
+    """Categorizes skills first, then normalizes them."""
+    raw_technical = acc.skills_raw_tech
+    raw_soft = acc.skills_raw_soft
+    raw_languages = acc.skills_raw_lang
+    classify = acc.skill_classes
 
     def _normalize_category(raw_skills: list) -> dict:
         """Helper to normalize a list of raw skills."""
         raw_counts = Counter(raw_skills)
-        normalized_data = defaultdict(lambda: {'total_count': 0, 'variants': Counter()})
+        totals = Counter()
+        variants = defaultdict(Counter)
         for skill, count in raw_counts.items():
-            canonical = normalizer.normalize(skill)
-            normalized_data[canonical]['total_count'] += count
-            normalized_data[canonical]['variants'][skill] = count
-        
-        # Sort variants inside each canonical skill
-        for canonical in normalized_data:
-            sorted_variants = sorted(normalized_data[canonical]['variants'].items(), key=lambda item: -item[1])
-            normalized_data[canonical]['variants'] = sorted_variants
-            
-        # Sort the whole dictionary by total_count
-        return dict(sorted(normalized_data.items(), key=lambda item: -item[1]['total_count']))
+            canonical = classify[skill][1]
+            totals[canonical] += count
+            variants[canonical][skill] = count
+
+        # Canonical skills by total_count, variants inside each by count
+        return {
+            canonical: {'total_count': total, 'variants': variants[canonical].most_common()}
+            for canonical, total in totals.most_common()
+        }
 
     technical = _normalize_category(raw_technical)
     soft = _normalize_category(raw_soft)
     languages = _normalize_category(raw_languages)
 
     # --- Co-occurrence Analysis (Combos) ---
-    combos = Counter()
-    for v in vacancies:
-        # We only want technical skills for combos
-        current_raw_tech = [s for s in v.get('skills', []) if not is_soft_skill(s) and not is_language_level(s)]
-        normalized_tech_in_vacancy = {normalizer.normalize(s) for s in current_raw_tech}
-        
-        unique_list = list(normalized_tech_in_vacancy)
-        for i, s1 in enumerate(unique_list):
-            for s2 in unique_list[i+1:]:
-                pair = tuple(sorted([s1, s2]))
-                combos[pair] += 1
-    
+    # Only the top pairs are translated back to names, in name order
+    tech_names = list(acc.tech_ids)
+    top_combos = [
+        [sorted((tech_names[i], tech_names[j])), count]
+        for (i, j), count in acc.combos.most_common(30)
+    ]
+
     return {
         'technical': technical,
         'soft': soft,
         'languages': languages,
         'total_mentions': len(raw_technical) + len(raw_soft) + len(raw_languages),
-        'unique_raw': len(Counter(raw_technical + raw_soft + raw_languages)),
+        'unique_raw': len(classify),  # one entry per distinct raw skill
         'unique_normalized': len(technical) + len(soft) + len(languages),
-        'combinations': [[list(k), v] for k, v in combos.most_common(30)]
+        'combinations': top_combos
     }
 
 
-def analyze_salaries(vacancies: list) -> dict:
-    """Analyze salary distributions"""
-    salaries = []
-    by_experience = defaultdict(list)
-    with_salary = 0
+def _percentile(data: list, p: int) -> int:
+    """Linear-interpolated percentile of an ascending list."""
+    k = (len(data) - 1) * p / 100
+    f = int(k)
+    c = f + 1 if f + 1 < len(data) else f
+    return int(data[f] + (k - f) * (data[c] - data[f]))
 
-    for v in vacancies:
-        salary = v.get('salary')
-        exp = v.get('experience') or 'Не указан'
 
-        if salary:
-            with_salary += 1
-            multiplier = 0.87 if salary.get('gross') else 1.0
+def _salary_stats(values: list, percentiles: tuple) -> dict:
+    """Summary stats of an ascending, non-empty list of salaries."""
+    stats = {
+        'min': values[0],
+        'max': values[-1],
+        'avg': int(sum(values) / len(values)),
+        'median': values[len(values) // 2],
+    }
+    for p in percentiles:
+        stats[f'p{p}'] = _percentile(values, p)
+    return stats
 
-            sfrom = salary.get('from')
-            sto = salary.get('to')
 
-            if sfrom and sto:
-                avg = int((sfrom + sto) / 2 * multiplier)
-            elif sfrom:
-                avg = int(sfrom * multiplier)
-            elif sto:
-                avg = int(sto * multiplier)
-            else:
-                continue
+def _add_salary(acc: Accumulators, salary: dict, exp: str):
+    """Records the (value, experience) pair of one vacancy's salary."""
+    if not salary:
+        return
+    acc.with_salary += 1
+    multiplier = 0.87 if salary.get('gross') else 1.0
 
-            salaries.append({
-                'value': avg,
-                'from': int(sfrom * multiplier) if sfrom else None,
-                'to': int(sto * multiplier) if sto else None,
-                'experience': exp
-            })
-            by_experience[exp].append(avg)
+    sfrom = salary.get('from')
+    sto = salary.get('to')
 
-    if not salaries:
-        return {'with_salary': 0, 'without_salary': len(vacancies)}
+    if sfrom and sto:
+        avg = int((sfrom + sto) / 2 * multiplier)
+    elif sfrom:
+        avg = int(sfrom * multiplier)
+    elif sto:
+        avg = int(sto * multiplier)
+    else:
+        return
 
-    all_values = [s['value'] for s in salaries]
-    all_values.sort()
+    acc.salary_values.append((avg, exp))
 
-    # Percentiles
-    def percentile(data, p):
-        k = (len(data) - 1) * p / 100
-        f = int(k)
-        c = f + 1 if f + 1 < len(data) else f
-        return int(data[f] + (k - f) * (data[c] - data[f]))
 
-    # Distribution with dynamic ranges
-    min_sal, max_sal = min(all_values), max(all_values)
+def analyze_salaries(acc: Accumulators) -> dict:
+    """Analyze salary distributions"""
+    salaries = acc.salary_values
+    with_salary = acc.with_salary
+
+    if not salaries:
+        return {'with_salary': 0, 'without_salary': acc.total}
+
+    # A single sort: experience groups are filled from the sorted salaries, so
+    # every group is already ordered (groups keep their first-seen order)
+    by_experience = {exp: [] for _, exp in salaries}
+    salaries.sort()
+    for value, exp in salaries:
+        by_experience[exp].append(value)
+    all_values = [value for value, _ in salaries]
+
+    # Distribution with dynamic ranges: one bucketing pass over the values,
+    # buckets come out ascending because all_values is sorted
     step = 50000
-    distribution = {}
-    current = (min_sal // step) * step
-    while current <= max_sal:
-        next_val = current + step
-        label = f"{current // 1000}k-{next_val // 1000}k"
-        count = len([s for s in all_values if current <= s < next_val])
-        if count > 0:
-            distribution[label] = count
-        current = next_val
+    bucket_counts = Counter(value // step for value in all_values)
+    distribution = {
+        f"{bucket * step // 1000}k-{(bucket + 1) * step // 1000}k": count
+        for bucket, count in bucket_counts.items()
+    }
 
     # By experience stats
     exp_stats = {}
     for exp, sals in by_experience.items():
         if sals:
-            sals.sort()
-            exp_stats[exp] = {
-                'min': min(sals),
-                'max': max(sals),
-                'avg': int(sum(sals) / len(sals)),
-                'median': sals[len(sals) // 2],
-                'p25': percentile(sals, 25),
-                'p75': percentile(sals, 75),
-                'count': len(sals)
-            }
+            exp_stats[exp] = {**_salary_stats(sals, (25, 75)), 'count': len(sals)}
 
     return {
         'with_salary': with_salary,
-        'without_salary': len(vacancies) - with_salary,
-        'min': min(all_values),
-        'max': max(all_values),
-        'avg': int(sum(all_values) / len(all_values)),
-        'median': all_values[len(all_values) // 2],
-        'p10': percentile(all_values, 10),
-        'p25': percentile(all_values, 25),
-        'p75': percentile(all_values, 75),
-        'p90': percentile(all_values, 90),
+        'without_salary': acc.total - with_salary,
+        **_salary_stats(all_values, (10, 25, 75, 90)),
         'distribution': distribution,
         'by_experience': exp_stats
     }
 
 
-def analyze_experience(vacancies: list) -> dict:
+def analyze_experience(acc: Accumulators) -> dict:
     """Analyze experience requirements"""
-    return dict(Counter(v.get('experience') or 'Не указан' for v in vacancies).most_common())
+    return dict(acc.exp_counter.most_common())
 
 
-def analyze_companies(vacancies: list) -> dict:
+def analyze_companies(acc: Accumulators) -> dict:
     """Analyze hiring companies"""
-    companies = Counter()
-    for v in vacancies:
-        name = (v.get('company') or {}).get('name') or 'Не указана'
-        companies[name] += 1
+    companies = acc.company_counter
 
     return {
         'all': [[k, v] for k, v in companies.most_common()],
@@ -316,153 +483,146 @@ def analyze_companies(vacancies: list) -> dict:
     }
 
 
-def analyze_titles(vacancies: list) -> dict:
-    """Analyze job titles"""
-    titles = [v.get('title', '') for v in vacancies]
-
-    # Seniority detection patterns
-    seniority_patterns = {
-        'Junior': [r'junior', r'джуниор', r'младш', r'\bjr\b'],
-        'Middle': [r'middle', r'миддл', r'\bmid\b'],
-        'Senior': [r'senior', r'сеньор', r'старш', r'\bsr\b'],
-        'Lead': [r'lead', r'лид', r'ведущ', r'principal', r'staff', r'team\s*lead'],
-        'Architect': [r'architect', r'архитектор'],
-    }
+# Inside each level and role, the patterns are ordered by how many titles they
+# hit on the bundled vacancy files (most first, ties in declaration order), so
+# the alternation tries the likely ones first. The order of the levels and roles
+# themselves is their priority and stays fixed.
+SENIORITY_PATTERNS = {
+    'Junior': [r'junior', r'младш', r'джуниор', r'\bjr\b'],
+    'Middle': [r'middle', r'миддл', r'\bmid\b'],
+    'Senior': [r'senior', r'старш', r'сеньор', r'\bsr\b'],
+    'Lead': [r'lead', r'ведущ', r'team\s*lead', r'лид', r'principal', r'staff'],
+    'Architect': [r'architect', r'архитектор'],
+}
 
-    role_patterns = {
-        'Backend': [r'backend', r'back-end', r'back end', r'бэкенд', r'бекенд'],
-        'Fullstack': [r'fullstack', r'full-stack', r'full stack', r'фулстек'],
-        'DevOps/SRE': [r'devops', r'sre', r'platform', r'infrastructure', r'инфраструктур'],
-        'Data/ML': [r'\bdata\b', r'\bml\b', r'machine', r'аналитик', r'data\s*engineer'],
-        'Frontend': [r'frontend', r'front-end', r'front end', r'фронтенд'],
-    }
+ROLE_PATTERNS = {
+    'Backend': [r'backend', r'бэкенд', r'back-end', r'бекенд', r'back end'],
+    'Fullstack': [r'fullstack', r'full-stack', r'full stack', r'фулстек'],
+    'DevOps/SRE': [r'platform', r'инфраструктур', r'devops', r'sre', r'infrastructure'],
+    'Data/ML': [r'\bdata\b', r'\bml\b', r'аналитик', r'machine', r'data\s*engineer'],
+    'Frontend': [r'frontend', r'front-end', r'front end', r'фронтенд'],
+}
 
-    seniority = defaultdict(int)
-    roles = defaultdict(int)
-
-    for title in titles:
-        t = title.lower()
-
-        # Seniority
-        found_seniority = False
-        for level, patterns in seniority_patterns.items():
-            if any(re.search(p, t) for p in patterns):
-                seniority[level] += 1
-                found_seniority = True
-                break
-        if not found_seniority:
-            seniority['Не указан'] += 1
-
-        # Role
-        found_role = False
-        for role, patterns in role_patterns.items():
-            if any(re.search(p, t) for p in patterns):
-                roles[role] += 1
-                found_role = True
-                break
-        if not found_role:
-            roles['Developer'] += 1
+SENIORITY_LEVELS = list(SENIORITY_PATTERNS)
+SENIORITY_RE = _fuse_ranked(SENIORITY_PATTERNS)
+ROLES = list(ROLE_PATTERNS)
+ROLE_RE = _fuse_ranked(ROLE_PATTERNS)
 
-    return {
-        'seniority': dict(seniority),
-        'roles': dict(roles),
-        'all': [[t, 1] for t in titles]
-    }
 
+def _add_title(acc: Accumulators, title: str):
+    """Classifies one title by seniority and role."""
+    acc.title_counter[title] += 1
 
-def analyze_locations(vacancies: list) -> dict:
-    """Analyze locations"""
-    cities = Counter()
+    # One match per classification; the winning group is the first level
+    # (or role) in priority order that occurs anywhere in the title
+    m = SENIORITY_RE.match(title)
+    acc.seniority[SENIORITY_LEVELS[m.lastindex - 1] if m else 'Не указан'] += 1
 
-    for v in vacancies:
-        loc = v.get('location')
-        if loc:
-            city = loc.split(',')[0].strip()
-            cities[city] += 1
-        else:
-            cities['Не указан'] += 1
+    m = ROLE_RE.match(title)
+    acc.roles[ROLES[m.lastindex - 1] if m else 'Developer'] += 1
 
-    # Remote work detection
-    remote_keywords = [r'удален', r'remote', r'дистанц', r'из любой точки', r'home\s*office']
-    remote_count = 0
-    hybrid_count = 0
-
-    for v in vacancies:
-        desc = (v.get('description') or '').lower()
-        if any(re.search(k, desc) for k in remote_keywords):
-            remote_count += 1
-        if re.search(r'гибрид|hybrid|офис.*удален|удален.*офис', desc):
-            hybrid_count += 1
 
+def analyze_titles(acc: Accumulators) -> dict:
+    """Analyze job titles"""
     return {
-        'cities': dict(cities.most_common()),
-        'remote_mentions': remote_count,
-        'hybrid_mentions': hybrid_count,
-        'remote_percent': round(remote_count / len(vacancies) * 100, 1)
+        'seniority': dict(acc.seniority),
+        'roles': dict(acc.roles),
+        'all': acc.title_counter.most_common()
     }
 
 
-def analyze_descriptions(vacancies: list) -> dict:
-    """Extract keywords and patterns from descriptions"""
-    keyword_patterns = {
-        'Микросервисы': r'микросервис|microservice',
-        'Highload': r'высоконагруж|highload|high.?load|нагрузк',
-        'Распределённые системы': r'распределен|distributed',
-        'Тестирование': r'\bтест|test|unit.?test|интеграцион',
-        'Agile/Scrum': r'agile|scrum|kanban|спринт',
-        'REST API': r'rest\s*api|restful',
-        'gRPC': r'grpc',
-        'GraphQL': r'graphql',
-        'Cloud': r'облак|cloud|aws|gcp|azure|yandex.?cloud',
-        'Безопасность': r'безопасност|security|защит',
-        'Оптимизация': r'оптимизац|optimization|performance|производительн',
-        'Архитектура': r'архитектур|architecture|design.?pattern',
-        'CI/CD': r'ci.?cd|деплой|deploy|pipeline',
-        'Мониторинг': r'мониторинг|monitoring|observability|метрик',
-        'Код-ревью': r'код.?ревью|code.?review|ревью кода',
-        'Менторство': r'ментор|mentor|обучен|наставн',
+# Remote keywords and the context markers below are ordered by how many
+# descriptions they hit on the bundled vacancy files, most first
+REMOTE_KEYWORDS = [r'удален', r'из любой точки', r'дистанц', r'remote', r'home\s*office']
+
+KEYWORD_PATTERNS = {
+    'Микросервисы': r'микросервис|microservice',
+    'Highload': r'высоконагруж|highload|high.?load|нагрузк',
+    'Распределённые системы': r'распределен|distributed',
+    'Тестирование': r'\bтест|test|unit.?test|интеграцион',
+    'Agile/Scrum': r'agile|scrum|kanban|спринт',
+    'REST API': r'rest\s*api|restful',
+    'gRPC': r'grpc',
+    'GraphQL': r'graphql',
+    'Cloud': r'облак|cloud|aws|gcp|azure|yandex.?cloud',
+    'Безопасность': r'безопасност|security|защит',
+    'Оптимизация': r'оптимизац|optimization|performance|производительн',
+    'Архитектура': r'архитектур|architecture|design.?pattern',
+    'CI/CD': r'ci.?cd|деплой|deploy|pipeline',
+    'Мониторинг': r'мониторинг|monitoring|observability|метрик',
+    'Код-ревью': r'код.?ревью|code.?review|ревью кода',
+    'Менторство': r'ментор|mentor|обучен|наставн',
+}
+
+# Description patterns run case-sensitively on the lowercased text: with
+# IGNORECASE the regex engine loses its fast literal scan on Cyrillic text.
+# One search per pattern also stops at the first hit, where a fused finditer
+# would have to walk the whole description.
+REMOTE_RE = re.compile('|'.join(REMOTE_KEYWORDS))
+HYBRID_RE = re.compile(r'гибрид|hybrid|офис.*удален|удален.*офис')
+KEYWORD_RES = {name: re.compile(p) for name, p in KEYWORD_PATTERNS.items()}
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+WORD_RE = re.compile(r'\b[a-zа-яё-]{3,}\b')
+
+
+def _add_description(acc: Accumulators, desc: str, stop_words: set):
+    """Keyword, remote/hybrid and bigram counting for one description;
+    the description is lowercased once for all of them."""
+    if not desc:
+        return
+    acc.with_description += 1
+    desc = desc.lower()
+    acc.descriptions_lower.append(desc)
+
+    # A keyword counts once per vacancy
+    acc.desc_keyword_counter.update(name for name, pattern in KEYWORD_RES.items() if pattern.search(desc))
+    if REMOTE_RE.search(desc):
+        acc.remote_count += 1
+    if HYBRID_RE.search(desc):
+        acc.hybrid_count += 1
+
+    clean_desc = HTML_TAG_RE.sub('', desc) # Strip HTML tags
+    words = WORD_RE.findall(clean_desc) # Find words (at least 3 chars)
+
+    filtered_words = [word for word in words if word not in stop_words and not is_soft_skill(word)]
+
+    # Count bigrams (two-word phrases) as word pairs; only the reported top
+    # ones are joined into strings. We avoid bigrams where both words are the
+    # same, e.g. "go go"
+    acc.bigram_counter.update(
+        pair for pair in zip(filtered_words, islice(filtered_words, 1, None)) if pair[0] != pair[1]
+    )
+
+
+def analyze_locations(acc: Accumulators) -> dict:
+    """Analyze locations"""
+    return {
+        'cities': dict(acc.city_counter.most_common()),
+        'remote_mentions': acc.remote_count,
+        'hybrid_mentions': acc.hybrid_count,
+        'remote_percent': round(acc.remote_count / acc.total * 100, 1)
     }
 
-    keywords = {}
-    for name, pattern in keyword_patterns.items():
-        count = sum(1 for v in vacancies
-                   if re.search(pattern, (v.get('description') or '').lower()))
-        if count > 0:
-            keywords[name] = count
+
+def analyze_descriptions(acc: Accumulators) -> dict:
+    """Extract keywords and patterns from descriptions"""
+    counts = acc.desc_keyword_counter
+    keywords = {name: counts[name] for name in KEYWORD_PATTERNS if counts[name] > 0}
 
     # Sort by count
     keywords = dict(sorted(keywords.items(), key=lambda x: -x[1]))
 
     return {
         'keywords': keywords,
-        'total_with_description': len([v for v in vacancies if v.get('description')])
+        'total_with_description': acc.with_description
     }
 
 
-def analyze_dynamic_keywords(vacancies: list, stop_words: set) -> dict:
+def analyze_dynamic_keywords(acc: Accumulators) -> dict:
     """Extracts frequent n-grams from descriptions to find emerging keywords."""
-    bigram_counter = Counter()
-    
-    for v in vacancies:
-        desc = (v.get('description') or '').lower()
-        if not desc:
-            continue
-        
-        clean_desc = re.sub(r'<[^>]+>', '', desc) # Strip HTML tags
-        words = re.findall(r'\b[a-zа-яё-]{3,}\b', clean_desc) # Find words (at least 3 chars)
-        
-        filtered_words = [word for word in words if word not in stop_words and not is_soft_skill(word)]
-        
-        # Count bigrams (two-word phrases)
-        for i in range(len(filtered_words) - 1):
-            # We avoid bigrams where both words are the same, e.g. "go go"
-            if filtered_words[i] != filtered_words[i+1]:
-                bigram = f"{filtered_words[i]} {filtered_words[i+1]}"
-                bigram_counter[bigram] += 1
-            
     # Filter bigrams that occur in at least 3 vacancies to reduce noise
     meaningful_bigrams = {
-        term: count for term, count in bigram_counter.most_common(50)
+        f"{first} {second}": count for (first, second), count in acc.bigram_counter.most_common(50)
         if count >= 3
     }
     
@@ -471,39 +631,109 @@ def analyze_dynamic_keywords(vacancies: list, stop_words: set) -> dict:
     }
 
 
-def analyze_skill_context(vacancies: list, technical_skills: list) -> dict:
+MANDATORY_MARKERS = [r'требования', r'ожидаем', r'уверенн', r'важно', r'необходимо', r'обязательно', r'требуется', r'нужен']
+PREFERRED_MARKERS = [r'будет плюсом', r'преимуществом', r'знакомство с', r'желательно', r'дополнительным', r'как плюс', r'хорошо если']
+
+# The lookahead reports a marker at every position where one starts, overlaps
+# included; no marker is a prefix of another, so each position has at most one
+MARKER_RE = re.compile(
+    f"(?=(?P<mandatory>{'|'.join(MANDATORY_MARKERS)})|(?P<preferred>{'|'.join(PREFERRED_MARKERS)}))"
+)
+
+
+def _marker_spans(desc: str) -> dict:
+    """Start and end offsets of all markers in desc, by kind, sorted by start."""
+    spans = {'mandatory': ([], []), 'preferred': ([], [])}
+    for m in MARKER_RE.finditer(desc):
+        starts, ends = spans[m.lastgroup]
+        starts.append(m.start())
+        ends.append(m.end(m.lastgroup))
+    return spans
+
+
+def _has_marker(starts: list, ends: list, lo: int, hi: int) -> bool:
+    """True if some marker lies entirely within desc[lo:hi]."""
+    for i in range(bisect_left(starts, lo), len(starts)):
+        if starts[i] >= hi:
+            break
+        if ends[i] <= hi:
+            return True
+    return False
+
+
+def _at_word_boundary(text: str, i: int) -> bool:
+    """Mirrors regex \\b at position i: a word character on exactly one side."""
+    before = i > 0 and (text[i - 1].isalnum() or text[i - 1] == '_')
+    after = i < len(text) and (text[i].isalnum() or text[i] == '_')
+    return before != after
+
+
+def _skill_finder(names: set):
+    """Returns find(text) yielding (start, end, name) for every whole-word
+    occurrence of the names, same as re.finditer(r'\b' + re.escape(name) + r'\b')
+    per name.
+
+    With ahocorasick all names are found in one pass over the text; the
+    fallback only runs a name's regex when the name occurs as a substring.
+    """
+    names = [name for name in names if name]
+    if ahocorasick is None:
+        patterns = [(name, re.compile(r'\b' + re.escape(name) + r'\b')) for name in names]
+
+        def find(text):
+            for name, pattern in patterns:
+                if name in text:
+                    for match in pattern.finditer(text):
+                        yield match.start(), match.end(), name
+        return find
+
+    automaton = _build_automaton(names)
+
+    def find(text):
+        # The automaton also reports overlapping hits of one name, finditer
+        # doesn't: a hit starting before the name's last accepted end is skipped
+        last_end = {}
+        for last, name in automaton.iter(text):
+            end = last + 1
+            start = end - len(name)
+            if start < last_end.get(name, 0):
+                continue
+            if _at_word_boundary(text, start) and _at_word_boundary(text, end):
+                last_end[name] = end
+                yield start, end, name
+    return find
+
+
+def analyze_skill_context(acc: Accumulators, technical_skills: dict) -> dict:
     """Analyzes the context of skills to determine if they are mandatory or preferred."""
-    
-    mandatory_markers = [r'требуется', r'обязательно', r'необходимо', r'требования', r'нужен', r'уверенн', r'ожидаем', r'важно']
-    preferred_markers = [r'будет плюсом', r'желательно', r'преимуществом', r'как плюс', r'дополнительным', r'хорошо если', r'знакомство с']
 
     mandatory_skills = Counter()
     preferred_skills = Counter()
 
-    skill_names = {skill.lower() for skill in technical_skills.keys()}
+    skill_names = {_lower(skill) for skill in technical_skills.keys()}
     # Add some common variations that might not be in the skills list
     skill_names.update(['rest', 'api', 'backend', 'frontend'])
+    # Whole-word matches of every skill name in one scan per description
+    find_skills = _skill_finder(skill_names)
 
+    for desc in acc.descriptions_lower:
+        # Markers are located once per description; each skill mention then
+        # only bisects into them instead of searching its own window
+        spans = _marker_spans(desc)
+        mandatory = spans['mandatory']
+        preferred = spans['preferred']
 
-    for v in vacancies:
-        desc = (v.get('description') or '').lower()
-        if not desc:
-            continue
-        
         # Using a window around the skill mention can be more robust than splitting by sentence
-        for skill_name in skill_names:
-            # Use word boundaries for more precise matching
-            for match in re.finditer(r'\b' + re.escape(skill_name) + r'\b', desc):
-                # Define a window of text around the match to check for markers
-                start = max(0, match.start() - 80)
-                end = min(len(desc), match.end() + 80)
-                context_window = desc[start:end]
-
-                # Check for markers in the context window
-                if any(re.search(marker, context_window) for marker in mandatory_markers):
-                    mandatory_skills[skill_name] += 1
-                if any(re.search(marker, context_window) for marker in preferred_markers):
-                    preferred_skills[skill_name] += 1
+        for match_start, match_end, skill_name in find_skills(desc):
+            # Define a window of text around the match to check for markers
+            start = max(0, match_start - 80)
+            end = min(len(desc), match_end + 80)
+
+            # Check for markers in the context window
+            if _has_marker(*mandatory, start, end):
+                mandatory_skills[skill_name] += 1
+            if _has_marker(*preferred, start, end):
+                preferred_skills[skill_name] += 1
 
     return {
         'mandatory': [[skill, count] for skill, count in mandatory_skills.most_common(40)],
@@ -520,9 +750,9 @@ def generate_insights(data: dict) -> list:
     # Check if 'descriptions' and 'keywords' exist before accessing
     top_desc_keywords = []
     if 'descriptions' in data and 'keywords' in data['descriptions']:
-        top_desc_keywords = list(data['descriptions']['keywords'].keys())[:5]
+        top_desc_keywords = list(islice(data['descriptions']['keywords'], 5))
 
-    top_tech_skills = list(data['skills']['technical'].keys())[:12]
+    top_tech_skills = list(islice(data['skills']['technical'], 12))
     resume_keywords = sorted(list(set(top_tech_skills + top_desc_keywords)), key=lambda x: x.lower())
     insights.append({
         'title': 'Ключевые слова для резюме',
@@ -571,26 +801,30 @@ def generate_insights(data: dict) -> list:
 
 
 def main():
-    vacancies = load_vacancies('vacancies.json')
-    print(f"Analyzing {len(vacancies)} vacancies with new features...")
+    # One pass over the vacancies updates every analysis; with ijson installed
+    # the vacancy dicts are not held in memory. The descriptions are: they are
+    # kept for the skill-context post-pass, so peak memory still grows with
+    # the total description text
+    stop_words = get_stop_words()
+    acc = accumulate(iter_vacancies('vacancies.json'), stop_words)
+    print(f"Analyzing {acc.total} vacancies with new features...")
 
     # --- Existing Analysis ---
-    skills = analyze_skills(vacancies)
-    salaries = analyze_salaries(vacancies)
-    experience = analyze_experience(vacancies)
-    companies = analyze_companies(vacancies)
-    titles = analyze_titles(vacancies)
-    locations = analyze_locations(vacancies)
-    descriptions = analyze_descriptions(vacancies)
+    skills = analyze_skills(acc)
+    salaries = analyze_salaries(acc)
+    experience = analyze_experience(acc)
+    companies = analyze_companies(acc)
+    titles = analyze_titles(acc)
+    locations = analyze_locations(acc)
+    descriptions = analyze_descriptions(acc)
 
     # --- New Analysis ---
-    stop_words = get_stop_words()
-    dynamic_keywords = analyze_dynamic_keywords(vacancies, stop_words)
-    skill_context = analyze_skill_context(vacancies, skills.get('technical', []))
+    dynamic_keywords = analyze_dynamic_keywords(acc)
+    skill_context = analyze_skill_context(acc, skills.get('technical', {}))
 
     data = {
         'meta': {
-            'total': len(vacancies),
+            'total': acc.total,
             'analyzed_at': '2026-01-02'
         },
         'skills': skills,
@@ -607,8 +841,7 @@ def main():
 
     data['insights'] = generate_insights(data)
 
-    with open('analysis_results.json', 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    save_results(data, 'analysis_results.json')
 
     print("Done! Results saved to analysis_results.json with new analysis.")
 
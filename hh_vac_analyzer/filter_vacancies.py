@@ -1,37 +1,49 @@
-
 import json
+import re
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib json module
+    orjson = None
+
+# Whole words only: a plain 'go' substring also matched titles like "Mongo"
+_GO_RE = re.compile(r'\b(?:go|golang)\b', re.IGNORECASE)
+
 
 def filter_vacancies():
     try:
-        with open('vacancies.json', 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        if orjson is not None:
+            data = orjson.loads(Path('vacancies.json').read_bytes())
+        else:
+            with open('vacancies.json', 'r', encoding='utf-8') as f:
+                data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError) as e:  # orjson's error subclasses JSONDecodeError
         print(f"Error reading vacancies.json: {e}")
         return
 
-    all_vacancies = data.get('vacancies', [])
     golang_vacancies = []
-    removed_vacancies = []
-
-    for vacancy in all_vacancies:
-        title = vacancy.get('title', '').lower()
+    removed_count = 0
 
-        if 'go' in title or 'golang' in title:
+    # Removed titles are printed as they are found instead of being collected
+    print("Удаленные вакансии:")
+    for vacancy in data.get('vacancies', []):
+        if _GO_RE.search(vacancy.get('title', '')):
             golang_vacancies.append(vacancy)
         else:
-            removed_vacancies.append(vacancy)
-
-    print("Удаленные вакансии:")
-    for vacancy in removed_vacancies:
-        print(f"- {vacancy.get('title')} (ID: {vacancy.get('id')})")
+            print(f"- {vacancy.get('title')} (ID: {vacancy.get('id')})")
+            removed_count += 1
 
     data['vacancies'] = golang_vacancies
-    
+
     try:
-        with open('vacancies.json', 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            Path('vacancies.json').write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open('vacancies.json', 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"\nСохранено {len(golang_vacancies)} вакансий golang.")
-        print(f"Удалено {len(removed_vacancies)} вакансий.")
+        print(f"Удалено {removed_count} вакансий.")
     except IOError as e:
         print(f"Error writing to vacancies.json: {e}")
 